@@ -1,15 +1,57 @@
 # apps/inventory/admin.py
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from .forms import ProductForm
 from .models import Category, Product
+from .paginators import TimeoutPaginator
+
+
+class DeferDescriptionChangeList(ChangeList):
+    """
+    Changelist that leaves out the `description` TextField. It is never shown
+    in the list but can hold large blobs; edit pages still load it normally.
+    """
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).defer('description')
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ('__str__', 'slug', 'parent') # Display hierarchy, slug, and parent in admin list view.
-    search_fields = ('name', 'description')
+    # A plain select_related() skips nullable FKs, so name the parent explicitly.
+    list_select_related = ('parent',)
+    search_fields = ('name', 'description')  # Also powers the category autocomplete widgets.
+    autocomplete_fields = ('parent',)  # AJAX search instead of rendering every category in a <select>.
+    # Only allow sorting on indexed columns to avoid full table scans.
+    ordering = ('name',)
+    sortable_by = ('slug',)
+    # Bound the changelist COUNT(*) and skip the second, unfiltered count.
+    paginator = TimeoutPaginator
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return DeferDescriptionChangeList
 
 @admin.register(Product)
 class ProductAdmin(admin.ModelAdmin):
-    list_display = ('__str__', 'category', 'price', 'stock')
+    list_display = ('name', 'category', 'price', 'stock', 'photo_status')
     search_fields = ('name', 'description')
-    list_filter = ('category',)
-    prepopulated_fields = {'slug': ('name',)}  # Auto-fill slug field based on name.
\ No newline at end of file
+    list_filter = (('category', admin.RelatedOnlyFieldListFilter),)  # Only categories that have products.
+    list_select_related = ('category',)  # JOIN the category in the changelist query to avoid N+1 lookups.
+    autocomplete_fields = ('category',)
+    # Only allow sorting on indexed columns; newest products first by default.
+    ordering = ('-created_at',)
+    sortable_by = ('name', 'price')
+    # Bound the changelist COUNT(*) and skip the second, unfiltered count.
+    paginator = TimeoutPaginator
+    show_full_result_count = False
+    prepopulated_fields = {'slug': ('name',)}  # Auto-fill slug field based on name.
+    # ProductForm edits the price in currency units and stores it as cents.
+    form = ProductForm
+    fields = ('name', 'slug', 'description', 'category', 'price', 'stock', 'photo')
+
+    def get_changelist(self, request, **kwargs):
+        return DeferDescriptionChangeList
+
+    @admin.display(description='price', ordering='price_cents')
+    def price(self, obj: Product):
+        return obj.price
\ No newline at end of file
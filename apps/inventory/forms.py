@@ -1,9 +1,26 @@
 # apps/inventory/forms.py
 from django import forms
+from django.urls import reverse_lazy
 from .models import Category, Product
 
 # Form for creating and updating Category instances.
 class CategoryForm(forms.ModelForm):
+    # The parent is typed by name and suggested by the autocomplete view,
+    # so the form never renders every category into a <select>.
+    # Validation is a single lookup by the (unique) name.
+    parent = forms.ModelChoiceField(
+        queryset=Category.objects.all(),
+        required=False,
+        to_field_name='name',
+        label='Parent category',
+        help_text="Parent category to which this subcategory belongs.",
+        widget=forms.TextInput(attrs={
+            'list': 'parent-options',
+            'autocomplete': 'off',
+            'data-autocomplete-url': reverse_lazy('inventory:category_autocomplete'),
+        }),
+    )
+
     class Meta:
         model = Category
         fields = ['name', 'slug', 'description', 'parent']
@@ -11,23 +28,43 @@ class CategoryForm(forms.ModelForm):
             'description': forms.Textarea(attrs={'rows': 4}),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Show the parent's name (not its id) when editing a subcategory.
+        if self.instance.parent_id:
+            self.initial['parent'] = self.instance.parent
+
 
 # Form for creating and updating Product instances.
 class ProductForm(forms.ModelForm):
+    # The model stores `price_cents`; the form keeps working with a decimal price.
+    # Negative values are rejected by the field itself and, ultimately, by the
+    # database CHECK constraint of the positive integer column.
+    price = forms.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        min_value=0,
+        error_messages={'min_value': "Price cannot be negative."},
+    )
+
     class Meta:
         model = Product
         fields = ['name', 'description', 'category', 'price', 'stock', 'photo']
         widgets = {
             'description': forms.Textarea(attrs={'rows': 4}),
         }
-    def clean_price(self):
-        price = self.cleaned_data.get('price')
-        if price is not None and price < 0:
-            raise forms.ValidationError("Price cannot be negative.")
-        return price
-    
-    def clean_stock(self):
-        stock = self.cleaned_data.get('stock')
-        if stock is not None and stock < 0:
-            raise forms.ValidationError("Stock cannot be negative.")
-        return stock
\ No newline at end of file
+        # `stock` is a PositiveIntegerField, so its form field already has min_value=0.
+        error_messages = {
+            'stock': {'min_value': "Stock cannot be negative."},
+        }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Show the current price when editing an existing product.
+        if self.instance.price_cents is not None:
+            self.initial.setdefault('price', self.instance.price)
+
+    def save(self, commit=True):
+        # Convert the validated price to cents on the instance before saving.
+        self.instance.price = self.cleaned_data['price']
+        return super().save(commit=commit)
\ No newline at end of file
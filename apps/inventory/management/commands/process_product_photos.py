@@ -0,0 +1,82 @@
+# apps/inventory/management/commands/process_product_photos.py
+import io
+
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand
+from django.db.models import QuerySet
+from PIL import Image
+
+from apps.inventory.models import Product
+
+# Largest width and height, in pixels, a stored product photo may have.
+MAX_PHOTO_SIZE = (1200, 1200)
+
+
+class Command(BaseCommand):
+    """
+    Processes product photos uploaded since the last run, outside the request cycle.
+    Meant to be run periodically, e.g. from cron: `python manage.py process_product_photos`.
+    """
+    help = "Resizes pending product photos and marks them as ready."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=100,
+            help="Maximum number of photos to process in this run.",
+        )
+
+    def handle(self, *args, **options):
+        pending = Product.objects.filter(photo_status=Product.PhotoStatus.PENDING)[:options['limit']]
+        processed = 0
+        for product in pending:
+            try:
+                self.process_photo(product)
+            except (OSError, ValueError, Image.DecompressionBombError) as error:
+                # Unreadable or oversized images leave the queue, so they cannot
+                # hold back new uploads; a photo uploaded in the meantime stays queued.
+                self.pending_photo(product, product.photo.name).update(photo_status=Product.PhotoStatus.FAILED)
+                self.stderr.write(f"Could not process the photo of '{product}': {error}")
+                continue
+            processed += 1
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} photo(s)."))
+
+    @staticmethod
+    def pending_photo(product: Product, name: str) -> QuerySet:
+        """
+        The product row, as long as it still holds the same pending photo.
+        A new upload during the run changes the name, so the update is skipped.
+        """
+        return Product.objects.filter(
+            pk=product.pk, photo=name, photo_status=Product.PhotoStatus.PENDING,
+        )
+
+    def process_photo(self, product: Product) -> None:
+        """
+        Shrinks the photo to fit MAX_PHOTO_SIZE, keeping its format.
+        """
+        original_name = name = product.photo.name
+        if name:
+            with product.photo.open('rb') as source:
+                image = Image.open(source)
+                image_format = image.format
+                needs_resize = image.width > MAX_PHOTO_SIZE[0] or image.height > MAX_PHOTO_SIZE[1]
+                if needs_resize:
+                    image.thumbnail(MAX_PHOTO_SIZE)
+                    buffer = io.BytesIO()
+                    image.save(buffer, format=image_format)
+
+            if needs_resize:
+                # Save the resized copy before removing the original, so a failed
+                # write never leaves the product without a photo. The name is taken,
+                # so the storage picks a free one next to it.
+                name = product.photo.storage.save(name, ContentFile(buffer.getvalue()))
+
+        updated = self.pending_photo(product, original_name).update(
+            photo=name, photo_status=Product.PhotoStatus.READY,
+        )
+        if name != original_name:
+            # Remove whichever file is no longer referenced: the original once the
+            # row points to the copy, or the copy if a new upload replaced both.
+            product.photo.storage.delete(original_name if updated else name)
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-14 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0004_alter_product_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['name'], name='inventory_p_name_f6a6a1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'name'], name='inventory_p_categor_d9b4a7_idx'),
+        ),
+    ]
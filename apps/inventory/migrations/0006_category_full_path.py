@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-14 14:28
+
+from django.db import migrations, models
+
+
+def populate_full_path(apps, schema_editor):
+    """
+    Stores the hierarchy of every existing category, parents first.
+    """
+    Category = apps.get_model('inventory', 'Category')
+    categories = {category.pk: category for category in Category.objects.all()}
+    paths = {}
+
+    def build(category, seen=()):
+        if category.pk not in paths:
+            parent = categories.get(category.parent_id)
+            if parent is None or parent.pk in seen:
+                paths[category.pk] = category.name
+            else:
+                paths[category.pk] = f"{build(parent, seen + (category.pk,))} > {category.name}"
+        return paths[category.pk]
+
+    for category in categories.values():
+        category.full_path = build(category)
+    Category.objects.bulk_update(categories.values(), ['full_path'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0005_product_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='full_path',
+            field=models.CharField(blank=True, editable=False, help_text="Full hierarchy of the category, e.g. 'Home > Furniture > Chairs'.", max_length=512, verbose_name='full path'),
+        ),
+        migrations.RunPython(populate_full_path, migrations.RunPython.noop),
+    ]
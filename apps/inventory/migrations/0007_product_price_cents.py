@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-14 14:40
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations, models
+
+
+def price_to_cents(apps, schema_editor):
+    Product = apps.get_model('inventory', 'Product')
+    products = list(Product.objects.only('pk', 'price'))
+    for product in products:
+        product.price_cents = int((product.price * 100).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+    Product.objects.bulk_update(products, ['price_cents'])
+
+
+def cents_to_price(apps, schema_editor):
+    Product = apps.get_model('inventory', 'Product')
+    products = list(Product.objects.only('pk', 'price_cents'))
+    for product in products:
+        product.price = Decimal(product.price_cents).scaleb(-2)
+    Product.objects.bulk_update(products, ['price'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0006_category_full_path'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='price_cents',
+            field=models.PositiveIntegerField(default=0, help_text='Price of the product, in cents.', verbose_name='price (cents)'),
+            preserve_default=False,
+        ),
+        # Nullable first, so reversing can re-add the column before refilling it.
+        migrations.AlterField(
+            model_name='product',
+            name='price',
+            field=models.DecimalField(decimal_places=2, help_text='Price of the product.', max_digits=10, null=True, verbose_name='price'),
+        ),
+        migrations.RunPython(price_to_cents, cents_to_price),
+        migrations.RemoveField(
+            model_name='product',
+            name='price',
+        ),
+    ]
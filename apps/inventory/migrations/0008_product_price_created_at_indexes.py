@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-14 14:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0007_product_price_cents'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['price_cents'], name='inventory_p_price_c_6b0d6a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['created_at'], name='inventory_p_created_081871_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-14 14:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0008_product_price_created_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='photo_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready')], default='ready', editable=False, help_text='Whether the photo is still waiting to be processed.', max_length=10, verbose_name='photo status'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-14 14:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0009_product_photo_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='price_cents',
+            field=models.PositiveBigIntegerField(help_text='Price of the product, in cents.', verbose_name='price (cents)'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-14 14:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_product_price_cents_bigint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='photo_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')], default='ready', editable=False, help_text='Whether the photo is still waiting to be processed.', max_length=10, verbose_name='photo status'),
+        ),
+    ]
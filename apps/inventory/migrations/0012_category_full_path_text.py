@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-14 14:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0011_product_photo_status_failed'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='full_path',
+            field=models.TextField(blank=True, editable=False, help_text="Full hierarchy of the category, e.g. 'Home > Furniture > Chairs'.", verbose_name='full path'),
+        ),
+    ]
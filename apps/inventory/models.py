@@ -5,9 +5,162 @@
 from __future__ import annotations
 
 import datetime  # Required for the date field type hints.
-from django.db import models
+import functools  # Provides `lru_cache` to memoize slug generation.
+import itertools  # Provides `count` to find the first free slug suffix.
+import operator  # Used to OR together the slug prefix filters.
+import re  # Regular expressions to parse numeric slug suffixes.
+from collections.abc import Callable, Iterable
+from decimal import ROUND_HALF_UP, Decimal
+from django.core.signals import setting_changed
+from django.db import IntegrityError, models, transaction
+from django.dispatch import receiver
 from django.utils.text import slugify  # Django function to create slugs.
-from django.urls import reverse  # Tool to generate URLs dynamically.
+from django.utils.translation import get_language
+from django.urls import get_script_prefix, get_urlconf, reverse  # Tools to generate URLs dynamically.
+from django.urls.converters import SlugConverter
+
+# How many times `save()` retries with a new slug after a unique collision.
+_MAX_SLUG_ATTEMPTS = 10
+# Slug prefixes OR-ed into a single query. SQLite nests each OR one level
+# deeper and rejects expression trees over 1000 levels deep.
+_SLUG_PREFIXES_PER_QUERY = 250
+# ASCII characters `slugify` drops: anything not a word character, whitespace or "-".
+_ASCII_SLUG_DROP = str.maketrans('', '', ''.join(
+    char for char in map(chr, range(128))
+    if not (char.isalnum() or char.isspace() or char in '_-')
+))
+# Runs of hyphens and whitespace collapse into a single hyphen.
+_DASH_SPACE_RE = re.compile(r'[-\s]+')
+# Valid slug reversed once in place of the real one when caching URL patterns.
+_SLUG_PLACEHOLDER = '__slug__'
+# Numeric suffix that follows the base slug, e.g. the "-3" in "office-chair-3".
+_SUFFIX_RE = re.compile(r'-(\d+)')
+# Slugs the `<slug:...>` URL converter accepts; only these may use the cached pattern.
+_URL_SLUG_RE = re.compile(SlugConverter.regex)
+
+
+def _fast_slugify(name: str) -> str:
+    """
+    Same result as `slugify`, with a fast path for pure-ASCII names (the
+    common case) that skips Unicode normalization and one regex pass.
+    """
+    if not name.isascii():
+        return slugify(name)
+    value = name.lower().translate(_ASCII_SLUG_DROP)
+    return _DASH_SPACE_RE.sub('-', value).strip('-_')
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_slugify(name: str) -> str:
+    """
+    Memoized slug generation. Bulk imports save many objects with repeated
+    names, so each distinct name is only slugified once.
+    """
+    return _fast_slugify(name)
+
+
+def _generate_unique_slug(base_slug: str, taken: set[str]) -> str:
+    """
+    Returns `base_slug` if it is free, otherwise `base_slug-N` where N is
+    the lowest positive suffix not already in use.
+    Works purely in memory over a set of slugs fetched in a single query.
+    """
+    if base_slug not in taken:
+        return base_slug
+    offset = len(base_slug)
+    used = {
+        int(match.group(1))
+        for slug in taken
+        if slug.startswith(base_slug) and (match := _SUFFIX_RE.fullmatch(slug, offset))
+    }
+    counter = next(number for number in itertools.count(1) if number not in used)
+    return f'{base_slug}-{counter}'
+
+
+@functools.lru_cache(maxsize=None)
+def _slug_url_pattern(viewname: str, script_prefix: str, urlconf: str | None, language: str | None) -> str:
+    """
+    Reverses `viewname` once with a placeholder slug, so building a URL only
+    needs a string substitution instead of a walk through the URLconf.
+    Everything `reverse()` depends on is part of the key: the script prefix,
+    the per-request URLconf and the active language (for translated URLs).
+    """
+    return reverse(viewname, urlconf=urlconf, kwargs={'slug': _SLUG_PLACEHOLDER})
+
+
+def _slug_url(viewname: str, slug: str) -> str:
+    # Invalid slugs (e.g. empty) go through `reverse()` so they still raise NoReverseMatch.
+    if not _URL_SLUG_RE.fullmatch(slug or ''):
+        return reverse(viewname, kwargs={'slug': slug})
+    pattern = _slug_url_pattern(viewname, get_script_prefix(), get_urlconf(), get_language())
+    return pattern.replace(_SLUG_PLACEHOLDER, slug)
+
+
+@receiver(setting_changed)
+def _clear_slug_url_patterns(*, setting: str, **kwargs) -> None:
+    """
+    Forgets the cached patterns when the project URLconf is swapped,
+    e.g. by `override_settings(ROOT_URLCONF=...)` in tests.
+    """
+    if setting == 'ROOT_URLCONF':
+        _slug_url_pattern.cache_clear()
+
+
+def _to_cents(amount: Decimal | float | int | str) -> int:
+    """
+    Converts a monetary amount to whole cents, rounding half up.
+    Floats go through `str` so that 199.99 becomes 19999, not 19998.
+    """
+    return int((Decimal(str(amount)) * 100).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+
+def _taken_slugs(queryset: models.QuerySet, base_slugs: Iterable[str]) -> set[str]:
+    """
+    Returns every slug in `queryset` that starts with one of `base_slugs`,
+    fetched in one query per `_SLUG_PREFIXES_PER_QUERY` distinct prefixes.
+    """
+    prefixes = [models.Q(slug__startswith=base_slug) for base_slug in set(base_slugs)]
+    taken: set[str] = set()
+    for start in range(0, len(prefixes), _SLUG_PREFIXES_PER_QUERY):
+        condition = functools.reduce(operator.or_, prefixes[start:start + _SLUG_PREFIXES_PER_QUERY])
+        taken.update(queryset.filter(condition).values_list('slug', flat=True))
+    return taken
+
+
+def _save_with_unique_slug(instance: models.Model, save: Callable[[], None], base_slug: str) -> None:
+    """
+    Runs `save` and, if the unique index rejects `instance.slug`, retries with
+    the lowest free suffix of `base_slug`. Shared by both models.
+    The database enforces uniqueness, so the happy path costs no extra SELECT
+    and is race-safe; the taken slugs are only read after a collision.
+    """
+    others = type(instance)._default_manager.exclude(pk=instance.pk)
+    taken: set[str] | None = None
+    for _ in range(_MAX_SLUG_ATTEMPTS):
+        try:
+            # The savepoint keeps any outer transaction usable after a failure.
+            with transaction.atomic():
+                save()
+            return
+        except IntegrityError:
+            if taken is None:
+                # Fetch every slug sharing our base in a single query;
+                # if we are updating, the object itself is excluded.
+                taken = _taken_slugs(others, [base_slug])
+                # The error came from another constraint: do not mask it.
+                if instance.slug not in taken:
+                    raise
+            else:
+                # Only blame a concurrent save if the slug we picked is really
+                # taken now; otherwise another constraint failed, so re-raise.
+                if not others.filter(slug=instance.slug).exists():
+                    raise
+                taken.add(instance.slug)
+            instance.slug = _generate_unique_slug(base_slug, taken)
+
+    # Last attempt: any remaining error propagates to the caller.
+    save()
+
 
 class Category(models.Model):
     """
@@ -44,6 +197,16 @@ class Category(models.Model):
         on_delete=models.PROTECT, # NEW CONCEPT: Prevents deletion if it has children.
         help_text="Parent category to which this subcategory belongs."
     )
+    # --- NEW CONCEPT: Denormalization ---
+    # The full hierarchy is stored on save, so displaying a category never
+    # needs to walk up the parent chain with one query per level.
+    # A TextField because the length grows with the depth of the tree.
+    full_path: str = models.TextField(
+        'full path',
+        blank=True,
+        editable=False, # Computed in `save()`, never edited by hand.
+        help_text="Full hierarchy of the category, e.g. 'Home > Furniture > Chairs'."
+    )
     # Timestamps for auditing.
     created_at: datetime.datetime = models.DateTimeField(auto_now_add=True)
     updated_at: datetime.datetime = models.DateTimeField(auto_now=True)
@@ -60,6 +223,20 @@ class Category(models.Model):
         Text representation of the object. Displays the full hierarchy.
         Example: 'Home > Furniture > Chairs'
         """
+        return self._display
+
+    @functools.cached_property
+    def _display(self) -> str:
+        """
+        The hierarchy, computed at most once per instance.
+        Unsaved objects have no stored path yet, so it is built on the fly.
+        """
+        return self.full_path or self._build_full_path()
+
+    def _build_full_path(self) -> str:
+        """
+        Computes the hierarchy from the parent's own (stored) path.
+        """
         if self.parent:
             return f"{self.parent} > {self.name}"
         return self.name
@@ -71,44 +248,96 @@ class Category(models.Model):
         Used by Django in the admin and by us in templates.
         """
         # 'inventory:category_details' must match the app_name and the name of a URL.
-        return reverse('inventory:category_details', kwargs={'slug': self.slug})
+        return _slug_url('inventory:category_details', self.slug)
 
     # --- NEW CONCEPT: Custom Business Logic on Save ---
     def save(self, *args, **kwargs) -> None:
         """
-        Overrides the save method to generate a unique and safe slug.
+        Overrides the save method to generate a unique and safe slug
+        and to keep the stored `full_path` of the whole subtree up to date.
         """
         # 1. Generate a slug from the name if it does not exist.
         if not self.slug:
-            self.slug = slugify(self.name)
-        
-        # 2. Ensure the slug is unique across the entire table.
-        #    This logic runs on both creation and update.
-        queryset = Category.objects.filter(slug=self.slug)
+            self.slug = _cached_slugify(self.name)
         
-        # 3. If we are updating (the object already has a primary key),
-        #    we exclude the object itself from the duplicate check.
-        if self.pk:
-            queryset = queryset.exclude(pk=self.pk)
-
-        # 4. If an object with this slug still exists, it is a genuine duplicate.
-        if queryset.exists():
-            # Save the original slug to use it as a base.
-            original_slug = self.slug
-            counter = 1
-            # Enter a loop until an available slug is found.
-            while Category.objects.filter(slug=self.slug).exists():
-                self.slug = f'{original_slug}-{counter}'
-                counter += 1
-        
-        # Call the parent's original `save` method to save the object to the database.
-        super().save(*args, **kwargs)
+        base_slug = self.slug
+
+        # Refresh the stored hierarchy; a rename or a move also affects descendants.
+        previous_path = self.full_path
+        self.full_path = self._build_full_path()
+        self.__dict__.pop('_display', None)  # Forget the memoized `__str__`.
+        path_changed = self.pk is not None and self.full_path != previous_path
+        # A partial save must still store the refreshed path, or the row would
+        # disagree with the descendant paths rewritten below.
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'full_path'}
+
+        # The row and its subtree change together: a failure while rewriting
+        # the descendants rolls back the save as well.
+        with transaction.atomic():
+            # 2. Save, retrying with a free slug if the unique index rejects ours.
+            _save_with_unique_slug(self, functools.partial(super().save, *args, **kwargs), base_slug)
+
+            # 3. Propagate the new path to every subcategory below this one.
+            if path_changed:
+                self._update_descendant_paths()
+
+    def refresh_from_db(self, *args, **kwargs) -> None:
+        super().refresh_from_db(*args, **kwargs)
+        self.__dict__.pop('_display', None)  # The name or parent may have changed.
+
+    def _update_descendant_paths(self) -> None:
+        """
+        Rewrites `full_path` for every descendant of this category.
+        Costs one SELECT and one UPDATE per level of depth, not per row.
+        """
+        level = [self]
+        visited = {self.pk}
+        while level:
+            paths = {category.pk: category.full_path for category in level}
+            # `visited` protects against accidental cycles in the hierarchy.
+            children = list(
+                Category.objects.filter(parent__in=level)
+                .exclude(pk__in=visited)
+                .only('pk', 'name', 'parent')
+            )
+            for child in children:
+                child.full_path = f"{paths[child.parent_id]} > {child.name}"
+                visited.add(child.pk)
+            Category.objects.bulk_update(children, ['full_path'])
+            level = children
+
+    @classmethod
+    def bulk_create_with_slugs(cls, objs: Iterable[Category]) -> list[Category]:
+        """
+        Creates many categories at once, generating unique slugs for them.
+        `bulk_create` skips `save()`, so slugs are resolved here with one SELECT
+        per few hundred distinct names and in-memory deduplication within the batch.
+        """
+        objs = list(objs)
+        for obj in objs:
+            if not obj.slug:
+                obj.slug = _cached_slugify(obj.name)
+            obj.full_path = obj._build_full_path()
+
+        taken = _taken_slugs(cls.objects.all(), (obj.slug for obj in objs))
+        for obj in objs:
+            obj.slug = _generate_unique_slug(obj.slug, taken)
+            # Reserve the slug so later objects in the batch cannot reuse it.
+            taken.add(obj.slug)
+
+        return cls.objects.bulk_create(objs)
 
 class Product(models.Model):
     """
     Represents a product in the inventory.
     Each product belongs to a category.
     """
+    # --- NEW CONCEPT: Choices ---
+    class PhotoStatus(models.TextChoices):
+        PENDING = 'pending', 'Pending'  # Uploaded, waiting for offline processing.
+        READY = 'ready', 'Ready'
+        FAILED = 'failed', 'Failed'  # Could not be processed; a new upload queues it again.
     name: str = models.CharField(
         'name',
         max_length=200,
@@ -133,11 +362,14 @@ class Product(models.Model):
         blank=True,
         help_text="Detailed description of the product."
     )
-    price: float = models.DecimalField(
-        'price',
-        max_digits=10,
-        decimal_places=2,
-        help_text="Price of the product."
+    # --- NEW CONCEPT: Money as Integer Cents ---
+    # Integers are compact, exact, and compare/sort faster than DECIMAL columns.
+    # The `price` property below keeps the familiar Decimal interface.
+    # A 64-bit column is needed to hold every price the form accepts
+    # (up to 99,999,999.99); a 32-bit one stops at 21,474,836.47.
+    price_cents: int = models.PositiveBigIntegerField(
+        'price (cents)',
+        help_text="Price of the product, in cents."
     )
     photo: str = models.ImageField(
         'photo',
@@ -145,6 +377,16 @@ class Product(models.Model):
         blank=True,
         help_text="Image of the product."
     )
+    # New photos are resized offline by the `process_product_photos` command,
+    # so uploads do not pay for image processing inside the request.
+    photo_status: str = models.CharField(
+        'photo status',
+        max_length=10,
+        choices=PhotoStatus.choices,
+        default=PhotoStatus.READY,
+        editable=False,
+        help_text="Whether the photo is still waiting to be processed."
+    )
     stock: int = models.PositiveIntegerField(
         'stock',
         default=0,
@@ -158,39 +400,70 @@ class Product(models.Model):
         verbose_name = "Product"
         verbose_name_plural = "Products"
         ordering = ['name']
+        # `slug` is already covered by its unique index; these back the default
+        # ordering, the "filter by category, order by name" lookups and the
+        # columns the admin is allowed to sort by.
+        indexes = [
+            models.Index(fields=['name']),
+            models.Index(fields=['category', 'name']),
+            models.Index(fields=['price_cents']),
+            models.Index(fields=['created_at']),
+        ]
 
     def __str__(self) -> str:
         return self.name
+
+    @property
+    def price(self) -> Decimal | None:
+        """
+        Price as a Decimal with two decimal places, derived from `price_cents`.
+        Also accepted as a keyword, e.g. `Product(price=Decimal('9.99'))`.
+        """
+        if self.price_cents is None:
+            return None
+        return Decimal(self.price_cents).scaleb(-2)
+
+    @price.setter
+    def price(self, value: Decimal | float | int | str | None) -> None:
+        self.price_cents = None if value is None else _to_cents(value)
     
     def get_absolute_url(self) -> str:
-        return reverse('inventory:product_details', kwargs={'slug': self.slug})
+        return _slug_url('inventory:product_details', self.slug)
     
     def save(self, *args, **kwargs) -> None:
         """
-        Overrides the save method to generate a unique and safe slug.
+        Overrides the save method to generate a unique and safe slug
+        and to queue newly uploaded photos for offline processing.
         """
         # 1. Generate a slug from the name if it does not exist.
         if not self.slug:
-            self.slug = slugify(self.name)
+            self.slug = _cached_slugify(self.name)
         
-        # 2. Ensure the slug is unique across the entire table.
-        #    This logic runs on both creation and update.
-        queryset = Product.objects.filter(slug=self.slug)
-        
-        # 3. If we are updating (the object already has a primary key),
-        #    we exclude the object itself from the duplicate check.
-        if self.pk:
-            queryset = queryset.exclude(pk=self.pk)
-
-        # 4. If an object with this slug still exists, it is a genuine duplicate.
-        if queryset.exists():
-            # Save the original slug to use it as a base.
-            original_slug = self.slug
-            counter = 1
-            # Enter a loop until an available slug is found.
-            while Product.objects.filter(slug=self.slug).exists():
-                self.slug = f'{original_slug}-{counter}'
-                counter += 1
-        
-        # Call the parent's original `save` method to save the object to the database.
-        super().save(*args, **kwargs)
\ No newline at end of file
+        base_slug = self.slug
+
+        # A photo that has not been written to storage yet is a new upload.
+        if self.photo and not self.photo._committed:
+            self.photo_status = self.PhotoStatus.PENDING
+
+        # 2. Save, retrying with a free slug if the unique index rejects ours.
+        _save_with_unique_slug(self, functools.partial(super().save, *args, **kwargs), base_slug)
+
+    @classmethod
+    def bulk_create_with_slugs(cls, objs: Iterable[Product]) -> list[Product]:
+        """
+        Creates many products at once, generating unique slugs for them.
+        `bulk_create` skips `save()`, so slugs are resolved here with one SELECT
+        per few hundred distinct names and in-memory deduplication within the batch.
+        """
+        objs = list(objs)
+        for obj in objs:
+            if not obj.slug:
+                obj.slug = _cached_slugify(obj.name)
+
+        taken = _taken_slugs(cls.objects.all(), (obj.slug for obj in objs))
+        for obj in objs:
+            obj.slug = _generate_unique_slug(obj.slug, taken)
+            # Reserve the slug so later objects in the batch cannot reuse it.
+            taken.add(obj.slug)
+
+        return cls.objects.bulk_create(objs)
\ No newline at end of file
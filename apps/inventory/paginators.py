@@ -0,0 +1,38 @@
+# apps/inventory/paginators.py
+from django.core.paginator import Paginator
+from django.db import OperationalError, connections, transaction
+from django.utils.functional import cached_property
+
+
+class TimeoutPaginator(Paginator):
+    """
+    Paginator that bounds the cost of `SELECT COUNT(*)` on large tables.
+    On PostgreSQL the count runs under a short statement timeout and falls back
+    to a large placeholder when it is cancelled. Other backends count as usual.
+    """
+    # Maximum time, in milliseconds, the count query may run.
+    count_timeout_ms = 200
+    # Reported instead of the real count when the query is cancelled.
+    fallback_count = 9999999999
+
+    @cached_property
+    def count(self) -> int:
+        using = getattr(self.object_list, 'db', None)
+        if using is None or connections[using].vendor != 'postgresql':
+            return super().count
+        try:
+            with transaction.atomic(using=using), connections[using].cursor() as cursor:
+                cursor.execute('SHOW statement_timeout')
+                previous_timeout = cursor.fetchone()[0]
+                cursor.execute(f'SET LOCAL statement_timeout TO {int(self.count_timeout_ms)}')
+                count = super().count
+                # Inside an outer transaction (ATOMIC_REQUESTS, a caller's `atomic()`)
+                # this block is only a savepoint, and releasing it keeps a `SET LOCAL`
+                # value until the outer transaction ends: put the old timeout back.
+                # A cancelled count skips this on purpose; the savepoint rollback
+                # already restores the old value, and the aborted savepoint would
+                # reject any further query.
+                cursor.execute("SELECT set_config('statement_timeout', %s, true)", [previous_timeout])
+                return count
+        except OperationalError:
+            return self.fallback_count
@@ -0,0 +1,8 @@
+# apps/inventory/tests/shop_urls.py
+# URLconf that mounts the inventory app under another prefix, used to check
+# that the canonical URLs follow `ROOT_URLCONF`.
+from django.urls import include, path
+
+urlpatterns = [
+    path('shop/', include('apps.inventory.urls')),
+]
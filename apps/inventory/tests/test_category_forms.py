@@ -0,0 +1,50 @@
+# apps/inventory/tests/test_category_forms.py
+from django.test import TestCase
+
+from ..models import Category
+from ..forms import CategoryForm
+
+
+class CategoryFormTests(TestCase):
+    """
+    Test suite for the Category form.
+    The form is validated directly: no URL dispatch, middleware or template rendering.
+    The full POST path for invalid data is still covered by
+    `CategoryViewTests.test_category_create_view_post_invalid_data`.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up the category edited by the update tests.
+        """
+        cls.category = Category.objects.create(name="Home", slug="home")
+
+    def test_missing_name_is_rejected(self):
+        """
+        Verifies that a form for a new category requires a name.
+        """
+        # ARRANGE & ACT: Validate a form without a name.
+        form = CategoryForm(data={'name': '', 'description': 'All tables and surfaces.', 'parent': ''})
+
+        # ASSERT: The form is invalid and the error is on the name field.
+        self.assertFalse(form.is_valid(), "The form should be invalid without a name.")
+        self.assertIn('name', form.errors, "The name field should report the error.")
+
+    def test_update_with_missing_name_is_rejected(self):
+        """
+        Verifies that editing a category cannot blank out its name,
+        and that the stored category stays unchanged.
+        """
+        # ARRANGE & ACT: Validate an edit form without a name.
+        form = CategoryForm(
+            data={'name': '', 'description': 'This description should not be saved.', 'parent': ''},
+            instance=self.category,
+        )
+
+        # ASSERT: The form is invalid and nothing reached the database.
+        self.assertFalse(form.is_valid(), "The form should be invalid without a name.")
+        self.assertIn('name', form.errors, "The name field should report the error.")
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.name, 'Home', "The category name should remain unchanged.")
+        self.assertNotEqual(self.category.description, 'This description should not be saved.', "The category description should not have been updated.")
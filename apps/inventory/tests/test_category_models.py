@@ -0,0 +1,216 @@
+# apps/inventory/tests/test_category_models.py
+from unittest import mock
+
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, reverse
+from django.db import IntegrityError
+from django.db.models.deletion import ProtectedError
+
+from ..models import Category, Product
+
+
+class CategoryModelTests(TestCase):
+    """
+    Test suite for the Category model.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up a parent category with one child once for the entire TestCase.
+        """
+        cls.parent_category = Category.objects.create(name="Office Furniture", slug="office")
+        cls.child_category = Category.objects.create(name="Desk Chairs", slug="chairs", parent=cls.parent_category)
+
+    def test_duplicate_name_is_not_masked_by_slug_retry(self):
+        """
+        Verifies that save() only retries on slug collisions.
+        A duplicate name violates a different unique constraint and must still fail.
+        """
+        # ACT & ASSERT: A category reusing the parent's name with a free slug fails.
+        with self.assertRaises(IntegrityError):
+            Category.objects.create(name="Office Furniture", slug="office-furniture-2")
+
+    def test_duplicate_name_with_auto_slug_fails_after_one_retry(self):
+        """
+        Verifies that a duplicate name whose generated slug is also taken
+        fails after a single retry instead of trying every suffix.
+        """
+        # ARRANGE: Make the generated slug collide too.
+        Category.objects.create(name="Lamps", slug="lamps")
+
+        # ACT & ASSERT: Reusing the name fails, capturing the queries.
+        with CaptureQueriesContext(connection) as context:
+            with self.assertRaises(IntegrityError):
+                Category.objects.create(name="Lamps")
+
+        # ASSERT: One INSERT with the taken slug, one with the free "lamps-1",
+        # then a check that "lamps-1" is free proves another constraint failed.
+        inserts = [query for query in context.captured_queries if query['sql'].startswith('INSERT')]
+        selects = [query for query in context.captured_queries if query['sql'].startswith('SELECT')]
+        self.assertEqual(len(inserts), 2, "The save should give up after the first retry.")
+        self.assertEqual(len(selects), 2, "The taken slugs and the retried slug should be read once each.")
+
+    def test_str_uses_stored_full_path_without_queries(self):
+        """
+        Verifies that the hierarchy is stored on save,
+        so displaying a subcategory does not query its ancestors.
+        """
+        # ARRANGE: Reload the child from the database, without its parent.
+        child = Category.objects.get(pk=self.child_category.pk)
+
+        # ACT & ASSERT: Rendering the hierarchy needs no extra queries.
+        with self.assertNumQueries(0):
+            self.assertEqual(str(child), "Office Furniture > Desk Chairs")
+
+    def test_get_absolute_url_matches_reverse(self):
+        """
+        Verifies that the cached URL pattern builds the same URL as reverse().
+        """
+        self.assertEqual(
+            self.parent_category.get_absolute_url(),
+            reverse('inventory:category_details', kwargs={'slug': 'office'})
+        )
+
+    def test_get_absolute_url_follows_root_urlconf(self):
+        """
+        Verifies that the cached URL pattern is rebuilt when the URLconf changes.
+        """
+        # ARRANGE: Warm the cache with the project URLconf.
+        self.assertEqual(self.parent_category.get_absolute_url(), "/inventory/categories/office/")
+
+        # ACT & ASSERT: With the app mounted elsewhere, the URL moves with it.
+        with override_settings(ROOT_URLCONF='apps.inventory.tests.shop_urls'):
+            self.assertEqual(self.parent_category.get_absolute_url(), "/shop/categories/office/")
+        self.assertEqual(self.parent_category.get_absolute_url(), "/inventory/categories/office/")
+
+    def test_get_absolute_url_rejects_empty_slug(self):
+        """
+        Verifies that an empty slug fails like reverse() instead of building a broken URL.
+        """
+        with self.assertRaises(NoReverseMatch):
+            Category(name="Unsaved").get_absolute_url()
+
+    def test_str_of_unsaved_category_is_memoized(self):
+        """
+        Verifies that an unsaved category builds its hierarchy only once.
+        """
+        # ARRANGE: An unsaved child pointing to a parent that is not loaded yet.
+        child = Category(name="Filing Cabinets", parent_id=self.parent_category.pk)
+
+        # ACT & ASSERT: Only the first call fetches the parent.
+        with self.assertNumQueries(1):
+            self.assertEqual(str(child), "Office Furniture > Filing Cabinets")
+            self.assertEqual(str(child), "Office Furniture > Filing Cabinets")
+
+    def test_renaming_category_updates_descendant_paths(self):
+        """
+        Verifies that renaming a category rewrites the stored path of all its descendants.
+        """
+        # ARRANGE: Add a third level below the shared child category.
+        leaf = Category.objects.create(name="Stools", slug="stools", parent=self.child_category)
+
+        # ACT: Rename the root category.
+        self.parent_category.name = "Workspace"
+        self.parent_category.save()
+
+        # ASSERT: Every level below reflects the new name.
+        self.child_category.refresh_from_db()
+        leaf.refresh_from_db()
+        self.assertEqual(self.child_category.full_path, "Workspace > Desk Chairs")
+        self.assertEqual(leaf.full_path, "Workspace > Desk Chairs > Stools")
+
+    def test_partial_save_stores_the_refreshed_path(self):
+        """
+        Verifies that save(update_fields=...) also writes the new `full_path`,
+        so the category agrees with the rewritten paths of its children.
+        """
+        # ACT: Rename the root category saving only its name.
+        self.parent_category.name = "Workspace"
+        self.parent_category.save(update_fields=['name'])
+
+        # ASSERT: The stored path of the root and of its child both changed.
+        self.parent_category.refresh_from_db()
+        self.child_category.refresh_from_db()
+        self.assertEqual(self.parent_category.full_path, "Workspace")
+        self.assertEqual(self.child_category.full_path, "Workspace > Desk Chairs")
+
+    def test_failed_path_propagation_rolls_back_the_save(self):
+        """
+        Verifies that the category and its subtree are saved in one transaction:
+        when rewriting the descendants fails, the rename is undone too.
+        """
+        # ARRANGE: Make rewriting the descendant paths fail.
+        self.parent_category.name = "Workspace"
+        with mock.patch.object(Category, '_update_descendant_paths', side_effect=DatabaseError("boom")):
+            # ACT & ASSERT: The error reaches the caller.
+            with self.assertRaises(DatabaseError):
+                self.parent_category.save()
+
+        # ASSERT: Neither the row nor its child was changed.
+        self.assertEqual(Category.objects.get(pk=self.parent_category.pk).name, "Office Furniture")
+        self.assertEqual(Category.objects.get(pk=self.child_category.pk).full_path, "Office Furniture > Desk Chairs")
+
+    def test_deep_hierarchy_with_long_names_fits_full_path(self):
+        """
+        Verifies that the stored path has no length limit: six levels of
+        100-character names (615 characters) are saved, renamed and validated.
+        """
+        # ARRANGE: Build six levels, each with a name of the maximum length.
+        category = None
+        for level in range(6):
+            category = Category.objects.create(name=str(level) * 100, slug=f"level-{level}", parent=category)
+        root = Category.objects.get(slug="level-0")
+
+        # ACT: Rename the root, which rewrites the path of every descendant.
+        root.name = "R" * 100
+        root.save()
+
+        # ASSERT: The deepest path is stored in full and passes model validation.
+        category.refresh_from_db()
+        self.assertEqual(len(category.full_path), 6 * 100 + 5 * 3)
+        self.assertTrue(category.full_path.startswith("R" * 100 + " > "))
+        category.full_clean()
+
+
+class ProtectedDeletionTests(TestCase):
+    """
+    Test suite for the on_delete=PROTECT rules of the inventory models.
+    These are INTEGRATION tests because they interact with the database
+    and validate an ORM rule.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up a parent category, one child category and one product in the child.
+        The parent is protected by its child, and the child by its product.
+        """
+        cls.parent_category = Category.objects.create(name="Office Furniture", slug="office")
+        cls.child_category = Category.objects.create(name="Desk Chairs", slug="chairs", parent=cls.parent_category)
+        Product.objects.create(name="Gaming Chair", slug="gaming-chair", category=cls.child_category, price=299.99, stock=7)
+
+    def test_protected_categories_cannot_be_deleted(self):
+        """
+        Verifies that a category with subcategories or with products cannot be deleted.
+        """
+        # NEW CONCEPT: subTest.
+        # Each case is reported separately when it fails, but all of them
+        # share one test method and one set of fixtures.
+        cases = {
+            'category with subcategories': self.parent_category,
+            'category with products': self.child_category,
+        }
+        for case, category in cases.items():
+            with self.subTest(case=case):
+                # ACT & ASSERT: Attempt to delete the category and expect a ProtectedError.
+                with self.assertRaises(ProtectedError):
+                    category.delete()
+
+                # ASSERT (Post-condition): Verify the category still exists.
+                self.assertTrue(
+                    Category.objects.filter(pk=category.pk).exists(),
+                    "The protected category should not have been deleted."
+                )
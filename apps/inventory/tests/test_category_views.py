@@ -0,0 +1,290 @@
+# apps/inventory/tests/test_category_views.py
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from ..models import Category
+from ..forms import CategoryForm
+from ..views import CategoryDeleteView
+
+
+class CategoryViewTests(TestCase):
+    """
+    Test suite for the Category views.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up a test category once for the entire TestCase.
+        Each test runs inside a transaction that is rolled back afterwards,
+        and Django gives every test its own copy of `cls.category`,
+        so tests may still modify or delete it safely.
+        """
+        cls.category = Category.objects.create(name="Home", slug="home")
+
+        # The URLs are resolved once here instead of calling reverse() in every test.
+        cls.url_add = reverse('inventory:category_add')
+        cls.url_list = reverse('inventory:category_list')
+        cls.url_autocomplete = reverse('inventory:category_autocomplete')
+        # These depend on the category, so they are built after it exists.
+        cls.url_details = reverse('inventory:category_details', kwargs={'slug': cls.category.slug})
+        cls.url_edit = reverse('inventory:category_edit', kwargs={'pk': cls.category.pk})
+        cls.url_delete = reverse('inventory:category_delete', kwargs={'pk': cls.category.pk})
+
+    def test_category_create_view_get_request(self):
+        """
+        Tests that the create view responds with HTTP 200 for GET requests.
+        """
+        # ACT: Make a GET request to the category creation URL.
+        response = self.client.get(self.url_add)
+
+        # ASSERT: Verify the conditions.
+        self.assertEqual(response.status_code, 200, "The view should return a 200 status.")
+        self.assertTemplateUsed(response, 'inventory/category_form.html', "The correct template should be used.")
+        # Verify that the form is in the context.
+        self.assertIn('form', response.context, "The context should contain a form.")
+        self.assertIsInstance(response.context['form'], CategoryForm, "The form should be an instance of CategoryForm.")
+
+    def test_category_create_view_post_success(self):
+        """
+        Tests that a valid POST request to the create view successfully creates a category.
+        """
+        # ARRANGE: Prepare the data for the new category.
+        form_data = {
+            'name': 'Chairs',
+            'description': 'All chairs and seating options.',
+            'parent': '',  # No parent category.
+        }
+
+        # ACT: Make a POST request to the category creation URL with the form data.
+        response = self.client.post(self.url_add, data=form_data)
+
+        # ASSERT: Verify the conditions.
+        # Check that the response is a redirect (HTTP 302).
+        self.assertEqual(response.status_code, 302, "The view should redirect after successful creation.")
+        # Verify that it redirects to the category list page.
+        self.assertRedirects(response, self.url_list)
+        # Verify that the category was created in the database.
+        self.assertTrue(
+            Category.objects.filter(name='Chairs').exists(),
+            "The new category should exist in the database."
+        )
+
+    def test_category_create_view_post_with_parent_name(self):
+        """
+        Tests that the parent category can be submitted by its name.
+        """
+        # ARRANGE: Reference the existing category by name as the parent.
+        form_data = {
+            'name': 'Kitchen',
+            'description': '',
+            'parent': 'Home',
+        }
+
+        # ACT: Make a POST request to the category creation URL.
+        response = self.client.post(self.url_add, data=form_data)
+
+        # ASSERT: The new category is linked to its parent.
+        self.assertRedirects(response, self.url_list)
+        self.assertEqual(Category.objects.get(name='Kitchen').parent, self.category)
+
+    def test_category_autocomplete_view_filters_by_name(self):
+        """
+        Tests that the autocomplete view only returns categories matching the query.
+        """
+        # ARRANGE: Add a category that should not match.
+        Category.objects.create(name="Garden", slug="garden")
+
+        # ACT: Search for part of the test category's name.
+        response = self.client.get(self.url_autocomplete, {'q': 'hom'})
+
+        # ASSERT: Only the matching category is suggested.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'results': [{'id': self.category.pk, 'name': 'Home'}]})
+
+    def test_category_create_view_post_invalid_data(self):
+        """
+        Tests that an invalid POST request to the create view does not create a category.
+        """
+        # ARRANGE: Prepare invalid data (missing 'name' field).
+        form_data = {
+            'name': '',  # Name is required.
+            'description': 'All tables and surfaces.',
+            'parent': '',
+        }
+
+        # ACT: Make a POST request to the category creation URL with invalid data.
+        response = self.client.post(self.url_add, data=form_data)
+
+        # ASSERT: Verify the conditions.
+        # Check that the response status code is 200 (form re-rendered with errors).
+        self.assertEqual(response.status_code, 200, "The view should return 200 for invalid form data.")
+        # Verify that the form is in the context and contains errors.
+        self.assertIn('form', response.context, "The context should contain a form.")
+        form = response.context['form']
+        self.assertIsInstance(form, CategoryForm, "The form should be an instance of CategoryForm.")
+        self.assertTrue(form.errors, "The form should contain errors for invalid data.")
+        # Verify that no new category was created in the database.
+        self.assertFalse(
+            Category.objects.filter(description='All tables and surfaces.').exists(),
+            "No new category should have been created in the database."
+        )
+
+    def test_category_list_view_success_with_data(self):
+        """
+        Tests that the list view responds with HTTP 200 and uses the correct template
+        when categories exist.
+        """
+        # ARRANGE: Add a subcategory so the list contains a parent relation.
+        Category.objects.create(name="Kitchen", slug="kitchen", parent=self.category)
+
+        # ACT: Make a GET request to the category list URL.
+        # The URL was resolved with reverse() in setUpTestData to avoid hardcoding it.
+        # NEW CONCEPT: assertNumQueries as a regression guard.
+        # The page must be rendered with the same two queries (1 COUNT for the
+        # paginator and 1 for the page) no matter how many categories exist;
+        # an N+1 in the template turns into a test failure.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url_list)
+
+        # ASSERT: Verify the conditions.
+        self.assertEqual(response.status_code, 200, "The view should return a 200 status.")
+        self.assertTemplateUsed(response, 'inventory/category_list.html', "The correct template should be used.")
+        # The parents were joined into the same query, so reading them is free.
+        with self.assertNumQueries(0):
+            parents = [category.parent for category in response.context['categories']]
+        self.assertIn(self.category, parents, "The subcategory's parent should be loaded.")
+    
+    def test_category_list_view_is_paginated(self):
+        """
+        Tests that the list view only renders one page of categories at a time.
+        """
+        # ARRANGE: Add enough categories to fill more than one page.
+        Category.objects.bulk_create([
+            Category(name=f"Room {number}", slug=f"room-{number}") for number in range(50)
+        ])
+
+        # ACT: Request the first and the second page.
+        first_page = self.client.get(self.url_list)
+        second_page = self.client.get(self.url_list, {'page': 2})
+
+        # ASSERT: The 51 categories are split into pages of 50.
+        self.assertTrue(first_page.context['is_paginated'], "The list should be paginated.")
+        self.assertEqual(len(first_page.context['categories']), 50, "The first page should hold 50 categories.")
+        self.assertEqual(len(second_page.context['categories']), 1, "The second page should hold the rest.")
+        self.assertContains(first_page, "Page 1 of 2")
+
+    def test_category_list_view_empty_state(self):
+        """
+        Tests that the list view behaves correctly when there are no categories.
+        """
+        # ARRANGE: Delete the category created in setUpTestData to simulate an empty database.
+        self.category.delete()
+
+        # ACT: Make the request to the view.
+        response = self.client.get(self.url_list)
+
+        # ASSERT:
+        self.assertEqual(response.status_code, 200)
+        # NEW CONCEPT: assertContains.
+        # Checks if the HTML content of the response contains specific text.
+        # This allows us to verify that our {% empty %} block works.
+        self.assertContains(response, "No categories available.")
+        # We can also verify the opposite.
+        # `.exists()` only asks whether any row matches instead of loading them all.
+        self.assertFalse(response.context['categories'].exists(), "The category queryset should be empty.")
+
+    def test_category_detail_view_success(self):
+        """
+        Tests that the detail view for a category works correctly.
+        """
+        # ARRANGE: Give the category subcategories so the template renders them.
+        Category.objects.create(name="Kitchen", slug="kitchen", parent=self.category)
+        Category.objects.create(name="Garden", slug="garden", parent=self.category)
+
+        # ACT: Make a request to the detail URL using the slug of our test category.
+        # Expected queries: 1 for the category and 1 for the prefetched children.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url_details)
+
+        # ASSERT:
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'inventory/category_details.html')
+        self.assertContains(response, "Kitchen")
+        # Verify that the context contains the category we expect.
+        self.assertEqual(response.context['category'], self.category)
+
+    def test_category_update_view_get_request(self):
+        """
+        Tests that the update view responds with HTTP 200 for GET requests.
+        """
+        # ACT: Make a GET request to the category update URL.
+        response = self.client.get(self.url_edit)
+
+        # ASSERT: Verify the conditions.
+        self.assertEqual(response.status_code, 200, "The view should return a 200 status.")
+        # Verify that the form is in the context.
+        self.assertIn('form', response.context, "The context should contain a form.")
+        self.assertIsInstance(response.context['form'], CategoryForm, "The form should be an instance of CategoryForm.")
+
+    def test_category_update_view_post_success(self):
+        """
+        Tests that a valid POST request to the update view successfully updates a category.
+        """
+        # ARRANGE: Prepare the updated data for the category.
+        form_data = {
+            'name': 'Updated Home',
+            'description': 'Updated description for home category.',
+            'parent': '',  # No parent category.
+        }
+
+        # ACT: Make a POST request to the category update URL with the form data.
+        response = self.client.post(self.url_edit, data=form_data)
+
+        # ASSERT: Verify the conditions.
+        # Check that the response is a redirect (HTTP 302).
+        self.assertEqual(response.status_code, 302, "The view should redirect after successful update.")
+        # Verify that it redirects to the category list page.
+        self.assertRedirects(response, self.url_list)
+        # Refresh the category from the database.
+        self.category.refresh_from_db()
+        # Verify that the category was updated in the database.
+        self.assertEqual(self.category.name, 'Updated Home', "The category name should have been updated.")
+        self.assertEqual(self.category.description, 'Updated description for home category.', "The category description should have been updated.")
+
+    def test_category_delete_view_get_request(self):
+        """
+        Tests that the delete view responds with HTTP 200 for GET requests.
+        """
+        # ARRANGE: Build the request by hand.
+        # NEW CONCEPT: RequestFactory.
+        # It creates a request object that we pass straight to the view,
+        # skipping the middleware chain. The view returns a TemplateResponse
+        # that has not been rendered yet, so the template engine never runs.
+        request = RequestFactory().get(self.url_delete)
+
+        # ACT: Call the view directly.
+        response = CategoryDeleteView.as_view()(request, pk=self.category.pk)
+
+        # ASSERT: Verify the conditions.
+        self.assertEqual(response.status_code, 200, "The view should return a 200 status.")
+        self.assertEqual(response.template_name, ['inventory/category_confirm_delete.html'], "The correct template should be used.")
+        # Verify that the category is in the context.
+        self.assertEqual(response.context_data['object'], self.category, "The context category should be the one to be deleted.")
+
+    def test_category_delete_view_post_request(self):
+        """
+        Tests that a POST request to the delete view deletes the category.
+        """
+        # ARRANGE: Verify the category exists before deletion.
+        category_pk = self.category.pk
+        self.assertTrue(Category.objects.filter(pk=category_pk).exists())
+
+        # ACT: Make a POST request to the category delete URL.
+        response = self.client.post(self.url_delete)
+
+        # ASSERT: Verify the redirection after deletion.
+        self.assertEqual(response.status_code, 302, "The view should redirect after deletion.")
+        self.assertRedirects(response, self.url_list)
+        # Verify that the category was deleted from the database.
+        self.assertFalse(Category.objects.filter(pk=category_pk).exists(), "The category should have been deleted from the database.")
@@ -0,0 +1,38 @@
+# apps/inventory/tests/test_conventions.py
+import importlib
+import pkgutil
+
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+from .. import tests as tests_package
+
+
+class TestSuiteConventionTests(SimpleTestCase):
+    """
+    Guards the conventions that keep this test suite fast.
+    """
+    # TransactionTestCase classes that really need commits (e.g. on_commit hooks).
+    ALLOWED_TRANSACTION_TEST_CASES: set[type] = set()
+
+    def test_database_tests_use_rollback_isolation(self):
+        """
+        Verifies that database tests inherit from TestCase, which rolls back a
+        savepoint after each test, instead of TransactionTestCase, which
+        truncates every table.
+        """
+        # Every test module of the package is inspected, not only this one.
+        modules = [
+            importlib.import_module(f'{tests_package.__name__}.{info.name}')
+            for info in pkgutil.iter_modules(tests_package.__path__)
+        ]
+        offenders = [
+            f'{module.__name__}.{obj.__name__}'
+            for module in modules
+            for obj in vars(module).values()
+            if isinstance(obj, type)
+            and obj.__module__ == module.__name__
+            and issubclass(obj, TransactionTestCase)
+            and not issubclass(obj, TestCase)
+            and obj not in self.ALLOWED_TRANSACTION_TEST_CASES
+        ]
+        self.assertEqual(offenders, [], "Use django.test.TestCase unless commits are required.")
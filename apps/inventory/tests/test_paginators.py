@@ -0,0 +1,100 @@
+# apps/inventory/tests/test_paginators.py
+import contextlib
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import SimpleTestCase, TestCase
+
+from ..models import Category
+from ..paginators import TimeoutPaginator
+
+
+class TimeoutPaginatorTests(TestCase):
+    """
+    Test suite for the admin TimeoutPaginator.
+    """
+
+    def test_count_is_exact_when_query_is_fast(self):
+        """
+        Verifies that the paginator reports the real count when the query completes.
+        """
+        # ARRANGE: Create a few categories.
+        Category.bulk_create_with_slugs(Category(name=name) for name in ("Beds", "Desks", "Lamps"))
+
+        # ACT: Paginate them.
+        paginator = TimeoutPaginator(Category.objects.all(), per_page=2)
+
+        # ASSERT: The count and the number of pages are exact.
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(paginator.num_pages, 2)
+
+
+class FakeCountQuerySet:
+    """
+    Stand-in for a queryset whose count either returns `result` or,
+    when `result` is an exception, raises it like a cancelled query.
+    """
+    db = 'default'
+    ordered = True
+
+    def __init__(self, result):
+        self.result = result
+
+    def count(self):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class TimeoutPaginatorPostgreSQLTests(SimpleTestCase):
+    """
+    Test suite for the PostgreSQL branch of the TimeoutPaginator.
+    NEW CONCEPT: mock.patch.
+    The tests run on SQLite, so the connection is replaced by a fake that
+    reports the 'postgresql' vendor and records the SQL sent to its cursor.
+    """
+
+    def setUp(self):
+        """
+        Installs a fake PostgreSQL connection whose timeout is currently '30s'.
+        """
+        self.cursor = mock.MagicMock()
+        self.cursor.fetchone.return_value = ('30s',)
+        connection = mock.MagicMock(vendor='postgresql')
+        connection.cursor.return_value.__enter__.return_value = self.cursor
+        for patcher in (
+            mock.patch('apps.inventory.paginators.connections', {'default': connection}),
+            mock.patch('apps.inventory.paginators.transaction.atomic', return_value=contextlib.nullcontext()),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def executed_sql(self) -> list[str]:
+        return [call.args[0] for call in self.cursor.execute.call_args_list]
+
+    def test_cancelled_count_falls_back_to_placeholder(self):
+        """
+        Verifies that a count cancelled by the statement timeout reports the fallback.
+        """
+        # ARRANGE & ACT: Paginate a queryset whose count is cancelled.
+        paginator = TimeoutPaginator(FakeCountQuerySet(OperationalError("canceling statement")), per_page=100)
+
+        # ASSERT: The placeholder is reported and the timeout was applied first.
+        self.assertEqual(paginator.count, TimeoutPaginator.fallback_count)
+        self.assertIn('SET LOCAL statement_timeout TO 200', self.executed_sql())
+
+    def test_previous_timeout_is_restored_after_count(self):
+        """
+        Verifies that a successful count puts the previous timeout back,
+        so it does not leak into the rest of an outer transaction.
+        """
+        # ARRANGE & ACT: Paginate a queryset whose count completes.
+        paginator = TimeoutPaginator(FakeCountQuerySet(42), per_page=100)
+
+        # ASSERT: The real count is reported and the old '30s' value is restored last.
+        self.assertEqual(paginator.count, 42)
+        self.assertEqual(self.executed_sql()[0], 'SHOW statement_timeout')
+        self.assertEqual(
+            self.cursor.execute.call_args_list[-1],
+            mock.call("SELECT set_config('statement_timeout', %s, true)", ['30s']),
+        )
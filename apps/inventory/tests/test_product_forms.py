@@ -0,0 +1,52 @@
+# apps/inventory/tests/test_product_forms.py
+from decimal import Decimal
+
+from django.test import TestCase
+
+from ..models import Category
+from ..forms import ProductForm
+
+
+class ProductFormTests(TestCase):
+    """
+    Test suite for the Product form.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up the category required to save a valid product.
+        """
+        cls.category = Category.objects.create(name="Desks", slug="desks")
+
+    def test_negative_price_and_stock_are_rejected(self):
+        """
+        Verifies that negative prices and stock levels are rejected with clear messages.
+        """
+        # ARRANGE & ACT: Validate a form with negative values.
+        form = ProductForm(data={'name': 'Broken Chair', 'price': '-1.00', 'stock': -3})
+
+        # ASSERT: Both fields report their error.
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors['price'], ["Price cannot be negative."])
+        self.assertEqual(form.errors['stock'], ["Stock cannot be negative."])
+
+    def test_largest_accepted_price_fits_the_column(self):
+        """
+        Verifies that the highest price the form accepts is stored exactly,
+        and that one more digit is rejected by the form instead of the database.
+        """
+        # ARRANGE & ACT: Save a product with the largest accepted price.
+        form = ProductForm(data={'name': 'Boardroom Table', 'category': self.category.pk, 'price': '99999999.99', 'stock': 1})
+        self.assertTrue(form.is_valid(), form.errors)
+        product = form.save()
+        product.refresh_from_db()
+
+        # ASSERT: The value round-trips through the cents column.
+        self.assertEqual(product.price_cents, 9999999999, "The price should be stored in cents.")
+        self.assertEqual(product.price, Decimal('99999999.99'))
+
+        # ASSERT: A price beyond the form's limits never reaches the database.
+        form = ProductForm(data={'name': 'Boardroom Table', 'category': self.category.pk, 'price': '100000000.00', 'stock': 1})
+        self.assertFalse(form.is_valid())
+        self.assertIn('price', form.errors)
@@ -0,0 +1,341 @@
+# apps/inventory/tests/test_product_models.py
+import io
+import shutil
+import tempfile
+from unittest import mock
+from decimal import Decimal
+
+from PIL import Image
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.text import slugify
+
+from ..management.commands.process_product_photos import Command
+from ..models import Category, Product, _fast_slugify, _generate_unique_slug
+
+
+class ProductModelTests(TestCase):
+    """
+    Test suite for the Product model.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up a test category to be used for product tests.
+        This runs once for the entire TestCase.
+        """
+        cls.category = Category.objects.create(name="Chairs", slug="chairs")
+
+    
+    def test_product_slug_is_autogenerated(self):
+        """
+        Verifies that the slug for a Product is automatically generated from its name if not provided.
+        """
+        # ARRANGE: Create a product without specifying a slug.
+        product = Product.objects.create(
+            name="Ergonomic Chair",
+            category=self.category,
+            price=199.99,
+            stock=10
+        )
+
+        # ASSERT: Verify that the slug was autogenerated correctly.
+        self.assertEqual(product.slug, "ergonomic-chair", "The slug should be autogenerated from the product name.")
+
+    def test_fast_slugify_matches_django_slugify(self):
+        """
+        Verifies that the ASCII fast path produces exactly the same slugs as Django.
+        """
+        names = [
+            "Ergonomic Chair", "  Desk -- Lamp  ", "Table (Oak), 2 m!", "_under_score_",
+            "tab\tand\nnewline", "100% Cotton & Linen", "Café Olé", "Ñandú chair",
+        ]
+        for name in names:
+            with self.subTest(name=name):
+                self.assertEqual(_fast_slugify(name), slugify(name))
+
+    def test_product_slug_is_unique_with_suffix(self):
+        """
+        Verifies that the slug for a Product is made unique by appending a suffix if a duplicate exists.
+        """
+        # ARRANGE: Create the first product with a specific name.
+        Product.objects.create(
+            name="Office Chair",
+            category=self.category,
+            price=149.99,
+            stock=5
+        )
+
+        # ACT: Create a second product with the same name.
+        second_product = Product.objects.create(
+            name="Office Chair",
+            category=self.category,
+            price=159.99,
+            stock=8
+        )
+
+        # ASSERT: Verify that the second product's slug has a suffix to ensure uniqueness.
+        self.assertEqual(second_product.slug, "office-chair-1", "The slug should have a '-1' suffix to ensure uniqueness.")
+
+    def test_product_slug_collision_reads_taken_slugs_once(self):
+        """
+        Verifies that a slug collision is resolved with a single SELECT
+        and that saving without a collision issues no SELECT at all.
+        """
+        # ARRANGE: Create the product that owns the base slug.
+        Product.objects.create(name="Footrest", category=self.category, price=40, stock=1)
+
+        # ACT: Create a second product with the same name, capturing the queries.
+        with CaptureQueriesContext(connection) as context:
+            product = Product.objects.create(name="Footrest", category=self.category, price=45, stock=1)
+
+        # ASSERT: Only one SELECT was needed to pick the free suffix.
+        selects = [query for query in context.captured_queries if query['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 1, "The taken slugs should be fetched exactly once.")
+        self.assertEqual(product.slug, "footrest-1")
+
+    def test_other_constraint_failure_is_not_retried_with_every_suffix(self):
+        """
+        Verifies that a product whose slug collides and whose price breaks its
+        CHECK constraint fails after a single retry.
+        """
+        # ARRANGE: Create the product that owns the base slug.
+        Product.objects.create(name="Ottoman", category=self.category, price=60, stock=1)
+
+        # ACT & ASSERT: A negative price cannot be saved under any slug.
+        with CaptureQueriesContext(connection) as context:
+            with self.assertRaises(IntegrityError):
+                Product.objects.create(name="Ottoman", category=self.category, price=-1, stock=1)
+
+        # ASSERT: The save gave up once the retried slug proved to be free.
+        inserts = [query for query in context.captured_queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 2, "The save should give up after the first retry.")
+
+    def test_price_is_stored_in_cents(self):
+        """
+        Verifies that the price is persisted as integer cents
+        and exposed again as a two-decimal Decimal.
+        """
+        # ARRANGE & ACT: Create a product with a float price and reload it.
+        product = Product.objects.create(name="Rocking Chair", slug="rocking-chair", category=self.category, price=199.99, stock=1)
+        product.refresh_from_db()
+
+        # ASSERT: The stored value is exact and the property round-trips.
+        self.assertEqual(product.price_cents, 19999, "The price should be stored in cents.")
+        self.assertEqual(product.price, Decimal("199.99"), "The price property should return a Decimal.")
+
+    def test_bulk_create_with_slugs_resolves_collisions(self):
+        """
+        Verifies that bulk creation generates unique slugs against the database
+        and within the batch, using one SELECT and one INSERT.
+        """
+        # ARRANGE: A product already owns the base slug.
+        Product.objects.create(name="Sofa Bed", category=self.category, price=300, stock=1)
+        new_products = [
+            Product(name="Sofa Bed", category=self.category, price=310, stock=1),
+            Product(name="Sofa Bed", category=self.category, price=320, stock=1),
+        ]
+
+        # ACT: Create both products in bulk.
+        with self.assertNumQueries(2):
+            created = Product.bulk_create_with_slugs(new_products)
+
+        # ASSERT: Each product received the next free suffix.
+        self.assertEqual([product.slug for product in created], ["sofa-bed-1", "sofa-bed-2"])
+
+    def test_bulk_create_with_slugs_handles_large_imports(self):
+        """
+        Verifies that a bulk import with more than 1000 distinct names works,
+        reading the taken slugs in batches instead of one oversized query.
+        """
+        # ARRANGE: One existing product collides with a name in the import.
+        Product.objects.create(name="Chair model 0", category=self.category, price=100, stock=1)
+        new_products = [
+            Product(name=f"Chair model {number}", category=self.category, price=100, stock=1)
+            for number in range(1500)
+        ]
+
+        # ACT: Create all of them in bulk.
+        created = Product.bulk_create_with_slugs(new_products)
+
+        # ASSERT: Every product was created with a unique slug.
+        self.assertEqual(len(created), 1500)
+        self.assertEqual(created[0].slug, "chair-model-0-1", "The colliding name should get a suffix.")
+        self.assertEqual(len({product.slug for product in created}), 1500)
+
+    def test_default_manager_allows_deferring_category(self):
+        """
+        Verifies that the default manager adds no JOIN of its own,
+        so `only()` and `defer()` may leave the category out.
+        """
+        # ARRANGE: Create a product in the test category.
+        Product.objects.create(name="Lounge Chair", slug="lounge-chair", category=self.category, price=250, stock=2)
+
+        # ACT & ASSERT: None of these querysets raise a FieldError.
+        self.assertEqual(list(Product.objects.only('name').values_list('name', flat=True)), ["Lounge Chair"])
+        self.assertEqual(Product.objects.defer('category').count(), 1)
+        self.assertEqual([product.name for product in self.category.products.only('name')], ["Lounge Chair"])
+
+
+class UniqueSlugGenerationTests(SimpleTestCase):
+    """
+    Unit tests for the in-memory slug generator shared by both models.
+    NEW CONCEPT: SimpleTestCase.
+    It does not set up a database transaction, and it fails if a test touches
+    the database. That makes sense here, because `_generate_unique_slug`
+    only works on a set of slugs that was already fetched.
+    """
+
+    def test_free_slug_is_returned_unchanged(self):
+        """
+        Verifies that a slug nobody uses is kept as is.
+        """
+        self.assertEqual(_generate_unique_slug("office-chair", set()), "office-chair")
+
+    def test_taken_slug_gets_first_suffix(self):
+        """
+        Verifies that a taken slug receives the '-1' suffix.
+        """
+        self.assertEqual(_generate_unique_slug("office-chair", {"office-chair"}), "office-chair-1")
+
+    def test_suffix_keeps_incrementing(self):
+        """
+        Verifies that further duplicates keep incrementing the numeric suffix.
+        """
+        taken = {"bar-stool", "bar-stool-1", "bar-stool-2"}
+        self.assertEqual(_generate_unique_slug("bar-stool", taken), "bar-stool-3", "The slug should use the next free suffix.")
+
+    def test_lowest_free_suffix_is_reused(self):
+        """
+        Verifies that a gap left by a deleted product is filled first.
+        """
+        taken = {"bar-stool", "bar-stool-2"}
+        self.assertEqual(_generate_unique_slug("bar-stool", taken), "bar-stool-1")
+
+    def test_similar_slugs_are_not_counted(self):
+        """
+        Verifies that slugs which only share the prefix do not affect the suffix.
+        """
+        taken = {"desk", "desk-lamp", "desk-lamp-1", "desk-2x"}
+        self.assertEqual(_generate_unique_slug("desk", taken), "desk-1")
+
+
+class ProductPhotoProcessingTests(TestCase):
+    """
+    Test suite for the offline product photo pipeline.
+    """
+
+    def setUp(self):
+        """
+        Stores uploaded files in a temporary MEDIA_ROOT removed after each test.
+        """
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.category = Category.objects.create(name="Sofas", slug="sofas")
+
+    def create_product(self, name: str, photo: bytes) -> Product:
+        """
+        Creates a product in the test category with an uploaded PNG photo.
+        """
+        return Product.objects.create(
+            name=name,
+            slug=slugify(name),
+            category=self.category,
+            price=700,
+            stock=1,
+            photo=SimpleUploadedFile(f"{slugify(name)}.png", photo, content_type="image/png"),
+        )
+
+    @staticmethod
+    def png(size: tuple[int, int]) -> bytes:
+        buffer = io.BytesIO()
+        Image.new('RGB', size).save(buffer, format='PNG')
+        return buffer.getvalue()
+
+    def test_uploaded_photo_is_pending_until_processed(self):
+        """
+        Verifies that a new photo is queued on save and resized by the management command.
+        """
+        # ARRANGE: Upload a photo larger than the maximum size.
+        product = self.create_product("Canvas Sofa", self.png((2400, 1200)))
+        original_name = product.photo.name
+        self.assertEqual(product.photo_status, Product.PhotoStatus.PENDING)
+
+        # ACT: Run the offline processing command.
+        call_command('process_product_photos', stdout=io.StringIO())
+
+        # ASSERT: The photo is ready and fits the maximum size.
+        product.refresh_from_db()
+        self.assertEqual(product.photo_status, Product.PhotoStatus.READY)
+        with product.photo.open('rb') as photo, Image.open(photo) as image:
+            self.assertEqual(image.size, (1200, 600))
+        # The original was only removed once the resized copy had been stored.
+        self.assertNotEqual(product.photo.name, original_name)
+        self.assertFalse(product.photo.storage.exists(original_name), "The original photo should be deleted.")
+
+    def test_photo_replaced_during_processing_is_kept(self):
+        """
+        Verifies that a photo uploaded while the command runs is not overwritten
+        by the resized copy of the previous one, and stays queued.
+        """
+        # ARRANGE: The command has loaded the product, then a new photo is uploaded.
+        product = self.create_product("Canvas Sofa", self.png((2400, 1200)))
+        stale = Product.objects.get(pk=product.pk)
+        product.photo = SimpleUploadedFile("new-sofa.png", self.png((2000, 1000)), content_type="image/png")
+        product.save()
+
+        # ACT: Process the photo the command had loaded.
+        Command().process_photo(stale)
+
+        # ASSERT: The new upload is untouched and still pending, and the resized
+        # copy of the old photo was removed instead of being left behind.
+        product.refresh_from_db()
+        self.assertEqual(product.photo.name, "products/new-sofa.png")
+        self.assertEqual(product.photo_status, Product.PhotoStatus.PENDING)
+        self.assertEqual(sorted(product.photo.storage.listdir("products")[1]), ["canvas-sofa.png", "new-sofa.png"])
+
+    def test_failed_photo_does_not_block_the_queue(self):
+        """
+        Verifies that an unreadable photo is marked as failed,
+        so later runs move on to the photos uploaded after it.
+        """
+        # ARRANGE: A broken upload that sorts first, and a valid one.
+        broken = self.create_product("Armchair", b"not an image")
+        valid = self.create_product("Bench", self.png((100, 100)))
+
+        # ACT: Process one photo per run, twice.
+        call_command('process_product_photos', limit=1, stdout=io.StringIO(), stderr=io.StringIO())
+        call_command('process_product_photos', limit=1, stdout=io.StringIO(), stderr=io.StringIO())
+
+        # ASSERT: The broken photo left the queue and the valid one was processed.
+        broken.refresh_from_db()
+        valid.refresh_from_db()
+        self.assertEqual(broken.photo_status, Product.PhotoStatus.FAILED)
+        self.assertEqual(valid.photo_status, Product.PhotoStatus.READY)
+
+    def test_decompression_bomb_does_not_abort_the_run(self):
+        """
+        Verifies that an image over Pillow's pixel limit fails on its own
+        instead of stopping the processing of the other photos.
+        """
+        # ARRANGE: Lower Pillow's limit so a 2400x1200 photo counts as a bomb.
+        bomb = self.create_product("Armchair", self.png((2400, 1200)))
+        valid = self.create_product("Bench", self.png((10, 10)))
+
+        # ACT: Process every pending photo in a single run.
+        with mock.patch.object(Image, 'MAX_IMAGE_PIXELS', 1000):
+            call_command('process_product_photos', stdout=io.StringIO(), stderr=io.StringIO())
+
+        # ASSERT: Only the oversized photo failed.
+        bomb.refresh_from_db()
+        valid.refresh_from_db()
+        self.assertEqual(bomb.photo_status, Product.PhotoStatus.FAILED)
+        self.assertEqual(valid.photo_status, Product.PhotoStatus.READY)
@@ -0,0 +1,210 @@
+# apps/inventory/tests/test_product_views.py
+from model_bakery import baker
+
+from django.test import TestCase
+from django.urls import reverse
+
+from ..models import Category, Product
+
+
+class ProductViewTests(TestCase):
+    """
+    Test suite for the Product views.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up data once for the entire test class.
+        We create two categories and two products to have realistic test data.
+        NEW CONCEPT: model_bakery.
+        `baker.make` fills in every field we do not care about. With
+        `_bulk_create=True` each pair is inserted with a single query, and an
+        iterator hands one value to each object. Since `bulk_create` skips
+        `save()`, the slugs are given explicitly.
+        """
+        cls.category1, cls.category2 = baker.make(
+            Category,
+            _quantity=2,
+            _bulk_create=True,
+            name=iter(["Tables", "Sofas"]),
+            slug=iter(["tables", "sofas"]),
+        )
+
+        cls.product1, cls.product2 = baker.make(
+            Product,
+            _quantity=2,
+            _bulk_create=True,
+            name=iter(["Dining Table", "Leather Sofa"]),
+            slug=iter(["dining-table", "leather-sofa"]),
+            category=iter([cls.category1, cls.category2]),
+            price_cents=iter([49999, 89999]),
+            stock=iter([3, 2]),
+        )
+
+    def test_inventory_home_view_joins_latest_products_category(self):
+        """
+        Tests that the home page lists the latest products with their category
+        without one extra query per product.
+        """
+        # ACT: Make a GET request to the inventory home URL.
+        # Expected queries: 2 counts and 1 for the latest products with their categories.
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('inventory:inventory_home'))
+
+        # ASSERT: Both products are shown with their category names.
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Dining Table")
+        self.assertContains(response, "Sofas")
+
+    def test_product_list_view_success_with_data(self):
+        """
+        Tests that the product list view responds with HTTP 200 and uses the correct template
+        when products exist.
+        """
+        # ACT: Make a GET request to the product list URL.
+        response = self.client.get(reverse('inventory:product_list'))
+
+        # ASSERT: Verify the conditions.
+        self.assertEqual(response.status_code, 200, "The view should return a 200 status.")
+        self.assertTemplateUsed(response, 'inventory/product_list.html', "The correct template should be used.")
+        # Verify that the context contains the products we created.
+        self.assertIn('products', response.context, "The context should contain products.")
+        products = response.context['products']
+        self.assertEqual(len(products), 2, "There should be two products in the context.")
+        self.assertIn(self.product1, products, "Product1 should be in the context.")
+        self.assertIn(self.product2, products, "Product2 should be in the context.")
+
+    def test_product_list_view_empty_state(self):
+        """
+        Tests that the product list view behaves correctly when there are no products.
+        """
+        # ARRANGE: Delete all products to simulate an empty database.
+        Product.objects.all().delete()
+
+        # ACT: Make the request to the view.
+        response = self.client.get(reverse('inventory:product_list'))
+
+        # ASSERT:
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "No products available.")
+        self.assertFalse(response.context['products'].exists(), "The product queryset should be empty.")
+
+    def test_product_list_view_optimization_with_select_related(self):
+        """
+        Tests that the product list view uses select_related to optimize database queries.
+        This helps prevent the N+1 query problem when accessing related category data.
+        """
+        # ACT: Make a GET request to the product list URL.
+        # Expected queries: 1 COUNT for the paginator and 1 for the page of products.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('inventory:product_list'))
+
+        # ASSERT: Verify the conditions.
+        self.assertEqual(response.status_code, 200)
+        products = response.context['products']
+        for product in products:
+            # Accessing the related category should not trigger additional queries.
+            _ = product.category.name
+
+    def test_product_list_view_skips_unused_columns(self):
+        """
+        Tests that the product list view does not load columns the template never shows.
+        """
+        # ACT: Make a GET request to the product list URL.
+        response = self.client.get(reverse('inventory:product_list'))
+
+        # ASSERT: Heavy columns are deferred on every product and its category.
+        for product in response.context['products']:
+            self.assertIn('description', product.get_deferred_fields(), "The description should not be loaded.")
+            self.assertIn('photo', product.get_deferred_fields(), "The photo should not be loaded.")
+            self.assertIn('description', product.category.get_deferred_fields(), "The category description should not be loaded.")
+
+    def test_product_detail_view_success(self):
+        """
+        Tests that the product detail view works correctly.
+        """
+        # ACT: Make a request to the detail URL using the slug of our test product.
+        response = self.client.get(reverse('inventory:product_details', kwargs={'slug': self.product1.slug}))
+
+        # ASSERT:
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'inventory/product_details.html')
+        # Verify that the context contains the product we expect.
+        self.assertEqual(response.context['product'], self.product1)
+
+    def test_product_detail_view_not_found(self):
+        """
+        Tests that the product detail view returns a 404 for a non-existent product.
+        """
+        # ACT: Make a request to the detail URL with a non-existent slug.
+        response = self.client.get(reverse('inventory:product_details', kwargs={'slug': 'non-existent-slug'}))
+
+        # ASSERT:
+        self.assertEqual(response.status_code, 404, "The view should return a 404 status for non-existent products.")
+    
+    def test_product_detail_view_optimization(self):
+        """
+        Tests that the product detail view uses select_related to optimize database queries.
+        This helps prevent additional queries when accessing related category data.
+        """
+        # ACT: Make a GET request to the product detail URL.
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('inventory:product_details', kwargs={'slug': self.product2.slug}))
+
+        # ASSERT: Verify the conditions.
+        self.assertEqual(response.status_code, 200)
+        product = response.context['product']
+        # Accessing the related category should not trigger additional queries.
+        _ = product.category.name
+
+    def test_product_create_view_post_stores_price_in_cents(self):
+        """
+        Tests that the product form converts the submitted price to cents.
+        """
+        # ARRANGE: Prepare the data for the new product.
+        form_data = {
+            'name': 'Coffee Table',
+            'description': 'Low oak table.',
+            'category': self.category1.pk,
+            'price': '45.50',
+            'stock': 4,
+        }
+
+        # ACT: Make a POST request to the product creation URL.
+        response = self.client.post(reverse('inventory:product_add'), data=form_data)
+
+        # ASSERT: The product was created with the price in cents.
+        self.assertRedirects(response, reverse('inventory:product_list'))
+        self.assertEqual(Product.objects.get(name='Coffee Table').price_cents, 4550)
+
+    def test_product_delete_view_get_request(self):
+        """
+        Tests that the delete view responds with HTTP 200 for GET requests.
+        """
+        # ACT: Make a GET request to the product delete URL.
+        response = self.client.get(reverse('inventory:product_delete', kwargs={'pk': self.product1.pk}))
+
+        # ASSERT: Verify the conditions.
+        self.assertEqual(response.status_code, 200, "The view should return a 200 status.")
+        self.assertTemplateUsed(response, 'inventory/product_confirm_delete.html', "The correct template should be used.")
+        # Verify that the product is in the context.
+        self.assertIn('product', response.context, "The context should contain the product.")
+        self.assertEqual(response.context['product'], self.product1, "The context product should be the one to be deleted.")
+
+    def test_product_delete_view_post_success(self):
+        """
+        Tests that a POST request to the delete view deletes the product.
+        """
+        # ARRANGE: Verify the product exists before deletion.
+        product_pk = self.product1.pk
+        self.assertTrue(Product.objects.filter(pk=product_pk).exists())
+
+        # ACT: Make a POST request to the product delete URL.
+        response = self.client.post(reverse('inventory:product_delete', kwargs={'pk': product_pk}))
+
+        # ASSERT: Verify the redirection after deletion.
+        self.assertEqual(response.status_code, 302, "The view should redirect after deletion.")
+        self.assertRedirects(response, reverse('inventory:product_list'))
+        # Verify that the product was deleted from the database.
+        self.assertFalse(Product.objects.filter(pk=product_pk).exists(), "The product should have been deleted from the database.")
@@ -1,25 +1,52 @@
 # apps/inventory/urls.py
 from django.urls import path
-from . import views
+from .views import (
+    InventoryHomeView,
+    CategoryListView,
+    CategoryDetailView,
+    CategoryCreateView,
+    CategoryUpdateView,
+    CategoryDeleteView,
+    CategoryAutocompleteView,
+    ProductListView,
+    ProductDetailView,
+    ProductCreateView,
+    ProductUpdateView,
+    ProductDeleteView,
+)
 
+# View callables are built once here and reused by the URL patterns below.
+inventory_home = InventoryHomeView.as_view()
+category_add = CategoryCreateView.as_view()
+category_autocomplete = CategoryAutocompleteView.as_view()
+category_list = CategoryListView.as_view()
+category_details = CategoryDetailView.as_view()
+category_edit = CategoryUpdateView.as_view()
+category_delete = CategoryDeleteView.as_view()
+product_add = ProductCreateView.as_view()
+product_list = ProductListView.as_view()
+product_details = ProductDetailView.as_view()
+product_edit = ProductUpdateView.as_view()
+product_delete = ProductDeleteView.as_view()
 
 app_name = 'inventory'
 
 urlpatterns = [
     # Root URL
-    path('', views.InventoryHomeView.as_view(), name='inventory_home'),
+    path('', inventory_home, name='inventory_home'),
 
     # Category URLs
-    path('categories/add/', views.CategoryCreateView.as_view(), name='category_add'),
-    path('categories/', views.CategoryListView.as_view(), name='category_list'),
-    path('categories/<slug:slug>/', views.CategoryDetailView.as_view(), name='category_details'),
-    path('categories/<int:pk>/edit/', views.CategoryUpdateView.as_view(), name='category_edit'),
-    path('categories/<int:pk>/delete/', views.CategoryDeleteView.as_view(), name='category_delete'),
+    path('categories/add/', category_add, name='category_add'),
+    path('categories/autocomplete/', category_autocomplete, name='category_autocomplete'),
+    path('categories/', category_list, name='category_list'),
+    path('categories/<slug:slug>/', category_details, name='category_details'),
+    path('categories/<int:pk>/edit/', category_edit, name='category_edit'),
+    path('categories/<int:pk>/delete/', category_delete, name='category_delete'),
 
     # Product URLs
-    path('products/add/', views.ProductCreateView.as_view(), name='product_add'),
-    path('products/', views.ProductListView.as_view(), name='product_list'),
-    path('products/<slug:slug>/', views.ProductDetailView.as_view(), name='product_details'),
-    path('products/<int:pk>/edit/', views.ProductUpdateView.as_view(), name='product_edit'),
-    path('products/<int:pk>/delete/', views.ProductDeleteView.as_view(), name='product_delete'),
+    path('products/add/', product_add, name='product_add'),
+    path('products/', product_list, name='product_list'),
+    path('products/<slug:slug>/', product_details, name='product_details'),
+    path('products/<int:pk>/edit/', product_edit, name='product_edit'),
+    path('products/<int:pk>/delete/', product_delete, name='product_delete'),
 ]
\ No newline at end of file
@@ -1,4 +1,6 @@
 # apps/inventory/views.py
+from django.http import JsonResponse
+from django.views import View
 from django.views.generic import TemplateView, ListView, DetailView, CreateView, UpdateView, DeleteView
 from .models import Category, Product
 from .forms import CategoryForm, ProductForm
@@ -12,7 +14,8 @@ class InventoryHomeView(TemplateView):
         context = super().get_context_data(**kwargs)
         context['category_count'] = Category.objects.count()
         context['product_count'] = Product.objects.count()
-        context['latest_products'] = Product.objects.order_by('-created_at')[:5]
+        # The template shows each product's category, so it is JOINed in the same query.
+        context['latest_products'] = Product.objects.select_related('category').order_by('-created_at')[:5]
         return context
 
 # List view for categories
@@ -20,6 +23,11 @@ class CategoryListView(ListView):
     model = Category
     template_name = 'inventory/category_list.html'
     context_object_name = 'categories'
+    # Only one page of categories is loaded and rendered per request.
+    paginate_by = 50
+
+    def get_queryset(self):
+        return Category.objects.select_related('parent')
 
 # Detail view for a single category
 class CategoryDetailView(DetailView):
@@ -27,6 +35,11 @@ class CategoryDetailView(DetailView):
     template_name = 'inventory/category_details.html'
     context_object_name = 'category'
 
+    def get_queryset(self):
+        # The template loops over `category.children.all` twice; prefetching
+        # loads the subcategories in one extra query instead of one per access.
+        return Category.objects.prefetch_related('children')
+
 # Create view for adding a new category
 class CategoryCreateView(CreateView):
     model = Category
@@ -47,15 +60,31 @@ class CategoryDeleteView(DeleteView):
     template_name = 'inventory/category_confirm_delete.html'
     success_url = reverse_lazy('inventory:category_list')
 
+# JSON endpoint that suggests categories by name for the parent field.
+class CategoryAutocompleteView(View):
+    # Maximum number of suggestions returned per request.
+    max_results = 20
+
+    def get(self, request, *args, **kwargs):
+        query = request.GET.get('q', '').strip()
+        categories = Category.objects.filter(name__icontains=query).values('id', 'name')[:self.max_results]
+        return JsonResponse({'results': list(categories)})
+
 # # apps/inventory/views.py (Product views)
 # List view for products.
 class ProductListView(ListView):
     model = Product
     template_name = 'inventory/product_list.html'
     context_object_name = 'products'
+    # Only one page of products is loaded and rendered per request.
+    paginate_by = 50
 
     def get_queryset(self):
-        return Product.objects.select_related('category')
+        # Only the columns the list template renders are fetched;
+        # the description and photo stay in the database.
+        return Product.objects.select_related('category').only(
+            'name', 'slug', 'price_cents', 'stock', 'category__name', 'category__slug',
+        )
 
 # Detail view for a single product.
 class ProductDetailView(DetailView):
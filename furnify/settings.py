@@ -78,6 +78,12 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # The test database lives in memory: no files, no fsync between tests.
+        # This is already Django's default for SQLite; it is stated here so it
+        # survives a change of NAME. With --parallel, each worker gets its own copy.
+        'TEST': {
+            'NAME': ':memory:',
+        },
     }
 }
 